@@ -1,92 +1,137 @@
 import os
-from typing import Optional
+import functools
+from typing import NamedTuple, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-class Config:
-    """Configuration class for the syllabus processing system using AWS services."""
+# Names of the settings checked by validate_config, in the order it reads them
+_REQUIRED_VARS = (
+    'AWS_ACCESS_KEY_ID',
+    'AWS_SECRET_ACCESS_KEY',
+    'AWS_REGION',
+    'S3_BUCKET_NAME',
+    'RDS_HOST',
+    'RDS_DB',
+    'RDS_USER',
+    'RDS_PASSWORD',
+    'OPENSEARCH_ENDPOINT',
+    'OPENSEARCH_USERNAME',
+    'OPENSEARCH_PASSWORD',
+    'BEDROCK_MODEL_ID'
+)
+
+class Config(NamedTuple):
+    """Configuration for the syllabus processing system using AWS services."""
     
     # AWS S3 Configuration (replaces Azure Blob Storage)
-    AWS_ACCESS_KEY_ID = os.getenv('AWS_ACCESS_KEY_ID')
-    AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
-    AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
-    S3_BUCKET_NAME = os.getenv('S3_BUCKET_NAME', 'syllabus-documents')
+    AWS_ACCESS_KEY_ID: Optional[str]
+    AWS_SECRET_ACCESS_KEY: Optional[str]
+    AWS_REGION: str
+    S3_BUCKET_NAME: str
+    S3_USE_ACCELERATE_ENDPOINT: bool
     
     # Amazon RDS PostgreSQL Configuration (replaces Azure PostgreSQL)
-    RDS_HOST = os.getenv('RDS_HOST')
-    RDS_PORT = int(os.getenv('RDS_PORT', '5432'))
-    RDS_DB = os.getenv('RDS_DB')
-    RDS_USER = os.getenv('RDS_USER')
-    RDS_PASSWORD = os.getenv('RDS_PASSWORD')
-    RDS_SSL_MODE = os.getenv('RDS_SSL_MODE', 'require')
+    RDS_HOST: Optional[str]
+    RDS_PORT: int
+    RDS_DB: Optional[str]
+    RDS_USER: Optional[str]
+    RDS_PASSWORD: Optional[str]
+    RDS_SSL_MODE: str
+    DB_POOL_MAX_CONN: int
     
     # Amazon OpenSearch Service Configuration (replaces Azure Cosmos DB)
-    OPENSEARCH_ENDPOINT = os.getenv('OPENSEARCH_ENDPOINT')
-    OPENSEARCH_USERNAME = os.getenv('OPENSEARCH_USERNAME')
-    OPENSEARCH_PASSWORD = os.getenv('OPENSEARCH_PASSWORD')
-    OPENSEARCH_INDEX = os.getenv('OPENSEARCH_INDEX', 'embeddings')
+    OPENSEARCH_ENDPOINT: Optional[str]
+    OPENSEARCH_USERNAME: Optional[str]
+    OPENSEARCH_PASSWORD: Optional[str]
+    OPENSEARCH_INDEX: str
     
     # AWS Bedrock Configuration (replaces Azure OpenAI)
-    BEDROCK_MODEL_ID = os.getenv('BEDROCK_MODEL_ID', 'amazon.titan-embed-text-v1')
-    BEDROCK_REGION = os.getenv('BEDROCK_REGION', 'us-east-1')
+    BEDROCK_MODEL_ID: str
+    BEDROCK_REGION: str
     
     # Application Configuration
-    APP_ENV = os.getenv('APP_ENV', 'development')
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    MAX_FILE_SIZE = int(os.getenv('MAX_FILE_SIZE', '52428800'))  # 50MB default
-    SUPPORTED_EXTENSIONS = os.getenv('SUPPORTED_EXTENSIONS', '.pdf,.doc,.docx').split(',')
+    APP_ENV: str
+    LOG_LEVEL: str
+    MAX_FILE_SIZE: int
+    SUPPORTED_EXTENSIONS: Tuple[str, ...]
+    UPLOAD_BATCH_SIZE: int
     
     # Security Configuration
-    SECRET_KEY = os.getenv('SECRET_KEY')
-    ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',')
-    
-    @classmethod
-    def get_database_url(cls) -> str:
-        """Generate PostgreSQL connection string from environment variables."""
-        if not all([cls.RDS_HOST, cls.RDS_DB, cls.RDS_USER, cls.RDS_PASSWORD]):
-            raise ValueError("Missing required RDS PostgreSQL environment variables")
-        
-        return f"postgresql://{cls.RDS_USER}:{cls.RDS_PASSWORD}@{cls.RDS_HOST}:{cls.RDS_PORT}/{cls.RDS_DB}?sslmode={cls.RDS_SSL_MODE}"
+    SECRET_KEY: Optional[str]
+    ALLOWED_HOSTS: Tuple[str, ...]
+
+def _build_config() -> Config:
+    """Read every setting from the environment exactly once."""
+    env = os.environ
+    return Config(
+        AWS_ACCESS_KEY_ID=env.get('AWS_ACCESS_KEY_ID'),
+        AWS_SECRET_ACCESS_KEY=env.get('AWS_SECRET_ACCESS_KEY'),
+        AWS_REGION=env.get('AWS_REGION', 'us-east-1'),
+        S3_BUCKET_NAME=env.get('S3_BUCKET_NAME', 'syllabus-documents'),
+        S3_USE_ACCELERATE_ENDPOINT=env.get('S3_USE_ACCELERATE_ENDPOINT', 'false').lower() == 'true',
+        RDS_HOST=env.get('RDS_HOST'),
+        RDS_PORT=int(env.get('RDS_PORT', '5432')),
+        RDS_DB=env.get('RDS_DB'),
+        RDS_USER=env.get('RDS_USER'),
+        RDS_PASSWORD=env.get('RDS_PASSWORD'),
+        RDS_SSL_MODE=env.get('RDS_SSL_MODE', 'require'),
+        DB_POOL_MAX_CONN=int(env.get('DB_POOL_MAX_CONN', '10')),
+        OPENSEARCH_ENDPOINT=env.get('OPENSEARCH_ENDPOINT'),
+        OPENSEARCH_USERNAME=env.get('OPENSEARCH_USERNAME'),
+        OPENSEARCH_PASSWORD=env.get('OPENSEARCH_PASSWORD'),
+        OPENSEARCH_INDEX=env.get('OPENSEARCH_INDEX', 'embeddings'),
+        BEDROCK_MODEL_ID=env.get('BEDROCK_MODEL_ID', 'amazon.titan-embed-text-v1'),
+        BEDROCK_REGION=env.get('BEDROCK_REGION', 'us-east-1'),
+        APP_ENV=env.get('APP_ENV', 'development'),
+        LOG_LEVEL=env.get('LOG_LEVEL', 'INFO'),
+        MAX_FILE_SIZE=int(env.get('MAX_FILE_SIZE', '52428800')),  # 50MB default
+        SUPPORTED_EXTENSIONS=tuple(env.get('SUPPORTED_EXTENSIONS', '.pdf,.doc,.docx').split(',')),
+        UPLOAD_BATCH_SIZE=int(env.get('UPLOAD_BATCH_SIZE', '500')),
+        SECRET_KEY=env.get('SECRET_KEY'),
+        ALLOWED_HOSTS=tuple(env.get('ALLOWED_HOSTS', 'localhost,127.0.0.1').split(','))
+    )
+
+# Create the global config instance
+config = _build_config()
+
+@functools.lru_cache(maxsize=1)
+def get_database_url() -> str:
+    """Generate PostgreSQL connection string from environment variables, once."""
+    cfg = config
+    if not (cfg.RDS_HOST and cfg.RDS_DB and cfg.RDS_USER and cfg.RDS_PASSWORD):
+        raise ValueError("Missing required RDS PostgreSQL environment variables")
     
-    @classmethod
-    def validate_config(cls) -> bool:
-        """Validate that all required configuration variables are set."""
-        required_vars = [
-            'AWS_ACCESS_KEY_ID',
-            'AWS_SECRET_ACCESS_KEY',
-            'AWS_REGION',
-            'S3_BUCKET_NAME',
-            'RDS_HOST',
-            'RDS_DB',
-            'RDS_USER',
-            'RDS_PASSWORD',
-            'OPENSEARCH_ENDPOINT',
-            'OPENSEARCH_USERNAME',
-            'OPENSEARCH_PASSWORD',
-            'BEDROCK_MODEL_ID'
-        ]
-        
-        missing_vars = []
-        for var in required_vars:
-            if not getattr(cls, var):
-                missing_vars.append(var)
-        
-        if missing_vars:
-            raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
-        
+    return f"postgresql://{cfg.RDS_USER}:{cfg.RDS_PASSWORD}@{cfg.RDS_HOST}:{cfg.RDS_PORT}/{cfg.RDS_DB}?sslmode={cfg.RDS_SSL_MODE}"
+
+def validate_config() -> bool:
+    """Validate that all required configuration variables are set."""
+    cfg = config
+    values = (
+        cfg.AWS_ACCESS_KEY_ID,
+        cfg.AWS_SECRET_ACCESS_KEY,
+        cfg.AWS_REGION,
+        cfg.S3_BUCKET_NAME,
+        cfg.RDS_HOST,
+        cfg.RDS_DB,
+        cfg.RDS_USER,
+        cfg.RDS_PASSWORD,
+        cfg.OPENSEARCH_ENDPOINT,
+        cfg.OPENSEARCH_USERNAME,
+        cfg.OPENSEARCH_PASSWORD,
+        cfg.BEDROCK_MODEL_ID
+    )
+    if all(values):
         return True
     
-    @classmethod
-    def is_production(cls) -> bool:
-        """Check if running in production environment."""
-        return cls.APP_ENV.lower() == 'production'
-    
-    @classmethod
-    def is_development(cls) -> bool:
-        """Check if running in development environment."""
-        return cls.APP_ENV.lower() == 'development'
+    missing_vars = [name for name, value in zip(_REQUIRED_VARS, values) if not value]
+    raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
+
+def is_production() -> bool:
+    """Check if running in production environment."""
+    return config.APP_ENV.lower() == 'production'
 
-# Create a global config instance
-config = Config()
+def is_development() -> bool:
+    """Check if running in development environment."""
+    return config.APP_ENV.lower() == 'development'
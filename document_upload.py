@@ -1,19 +1,250 @@
 import os
+import asyncio
+import sys
 import uuid
-from datetime import datetime
-from typing import Optional, Dict, Any
-from pathlib import Path
-import mimetypes
+import weakref
+import functools
+import threading
+from typing import Optional, Dict, Any, BinaryIO, List, Tuple
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
 
-# AWS SDK imports (you'll need to install these)
-import boto3
-from botocore.exceptions import ClientError
-import psycopg2
-from psycopg2.extras import RealDictCursor
+# AWS SDK and database driver imports (you'll need to install these).
+# They take a few hundred milliseconds to load, so the _import_* helpers below
+# import them on first use and bind them to these module globals.
+boto3 = TransferConfig = BotoConfig = ClientError = None
+psycopg2 = execute_values = TRANSACTION_STATUS_IDLE = None
+aioboto3 = asyncpg = None
 
 # Import configuration
-from config import config
+from config import config, get_database_url, validate_config
+
+# Set up logging once for the module
+logging.basicConfig(level=getattr(logging, config.LOG_LEVEL, logging.INFO))
+logger = logging.getLogger(__name__)
+
+# Maximum upload size in bytes, from config
+_MAX_FILE_SIZE = config.MAX_FILE_SIZE
+
+# Supported file extensions from config, and the message listing them
+_SUPPORTED_EXTENSIONS = frozenset(sys.intern(ext.lower()) for ext in config.SUPPORTED_EXTENSIONS)
+_SUPPORTED_EXTENSIONS_MSG = ', '.join(sorted(_SUPPORTED_EXTENSIONS))
+
+# MIME types for the supported document formats
+_MIME_TYPES = {
+    '.pdf': 'application/pdf',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+}
+
+# Shared boto3 session and S3 multipart settings, set up by _import_boto3()
+_boto3_session = None
+_TRANSFER_CONFIG = None
+
+# Concurrent parts per multipart upload and concurrent files per batch; the
+# S3 client's connection pool is sized for both so threads never wait on it
+_S3_MAX_CONCURRENCY = 8
+_S3_UPLOAD_WORKERS = 8
+_S3_MAX_POOL_CONNECTIONS = _S3_MAX_CONCURRENCY * _S3_UPLOAD_WORKERS
+
+# INSERT for document metadata with positional parameters; upload_date uses the column default
+_INSERT_DOCUMENT = """
+    INSERT INTO documents (
+        document_id, 
+        user_id,
+        file_name, 
+        file_extension, 
+        file_size, 
+        mime_type, 
+        s3_url, 
+        status
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+"""
+
+# Server-side prepared form of _INSERT_DOCUMENT, created once per pooled connection
+_PREPARE_INSERT_DOCUMENT = "PREPARE insert_document AS" + _INSERT_DOCUMENT
+_EXECUTE_INSERT_DOCUMENT = "EXECUTE insert_document (%s, %s, %s, %s, %s, %s, %s, %s)"
+
+# Serializes first-use setup of the shared SDK clients and connection pools
+_setup_lock = threading.RLock()
+
+# Pooled connections that already have insert_document prepared
+_prepared_connections = weakref.WeakSet()
+
+# Shared aioboto3 session for the async upload pipeline, set up by _import_async_clients()
+_aioboto3_session = None
+
+def _import_boto3() -> None:
+    """Import boto3 and botocore on first use and set up the shared session."""
+    global boto3, TransferConfig, BotoConfig, ClientError, _boto3_session, _TRANSFER_CONFIG
+    if _boto3_session is not None:
+        return
+    
+    with _setup_lock:
+        if _boto3_session is not None:
+            return
+        
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config as BotoConfig
+        from botocore.exceptions import ClientError
+        import boto3
+        
+        # Multipart settings for S3 uploads: files over 8MB go up in concurrent 8MB parts
+        _TRANSFER_CONFIG = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=_S3_MAX_CONCURRENCY,
+            use_threads=True
+        )
+        
+        # Shared boto3 session; clients are created from it once per credential set
+        _boto3_session = boto3.session.Session()
+
+def _import_psycopg2() -> None:
+    """Import the psycopg2 helpers on first use."""
+    global psycopg2, execute_values, TRANSACTION_STATUS_IDLE
+    if psycopg2 is not None:
+        return
+    
+    with _setup_lock:
+        if psycopg2 is not None:
+            return
+        
+        from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+        from psycopg2.extras import execute_values
+        import psycopg2
+
+def _import_async_clients() -> None:
+    """Import aioboto3 and asyncpg on first use and set up the shared session."""
+    global aioboto3, asyncpg, _aioboto3_session
+    _import_boto3()
+    if _aioboto3_session is not None:
+        return
+    
+    with _setup_lock:
+        if _aioboto3_session is not None:
+            return
+        
+        import asyncpg
+        import aioboto3
+        _aioboto3_session = aioboto3.Session()
+
+async def _import_async_clients_off_loop() -> None:
+    """Run the first-use import of the async clients in a worker thread, not on the event loop."""
+    if _aioboto3_session is None:
+        await asyncio.to_thread(_import_async_clients)
+
+@functools.lru_cache(maxsize=8)
+def _build_s3_client(aws_access_key_id: str, aws_secret_access_key: str, aws_region: str):
+    _import_boto3()
+    return _boto3_session.client(
+        's3',
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        region_name=aws_region,
+        config=BotoConfig(
+            max_pool_connections=_S3_MAX_POOL_CONNECTIONS,
+            s3={'use_accelerate_endpoint': config.S3_USE_ACCELERATE_ENDPOINT}
+        )
+    )
+
+def _get_s3_client(aws_access_key_id: str, aws_secret_access_key: str, aws_region: str):
+    """
+    Return a shared S3 client for the given credentials and region.
+    
+    boto3 low-level clients are thread-safe, so one client can serve every
+    uploader that uses the same credentials. Creating clients from the shared
+    Session is not thread-safe, so it happens under the setup lock.
+    """
+    with _setup_lock:
+        return _build_s3_client(aws_access_key_id, aws_secret_access_key, aws_region)
+
+class _BlockingConnectionPool:
+    """
+    Thread-safe PostgreSQL connection pool that waits when exhausted.
+    
+    Connections are opened on demand up to maxconn and every returned
+    connection is kept open for reuse. psycopg2's ThreadedConnectionPool
+    closes returned connections beyond minconn and raises PoolError when
+    exhausted, so it is not used here.
+    """
+    
+    def __init__(self, db_connection_string: str, maxconn: int):
+        self._dsn = db_connection_string
+        self._idle = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(maxconn)
+    
+    def getconn(self):
+        """Check out a connection, blocking while all of them are in use."""
+        self._slots.acquire()
+        try:
+            with self._lock:
+                if self._idle:
+                    return self._idle.pop()
+            return psycopg2.connect(self._dsn)
+        except BaseException:
+            self._slots.release()
+            raise
+    
+    def putconn(self, conn) -> None:
+        """Return a connection to the pool, rolling back any open transaction."""
+        try:
+            if not conn.closed and conn.info.transaction_status != TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            if not conn.closed:
+                with self._lock:
+                    self._idle.append(conn)
+        except Exception:
+            # A connection that cannot be reset is dropped rather than reused
+            conn.close()
+        finally:
+            self._slots.release()
+
+@functools.lru_cache(maxsize=8)
+def _build_db_pool(db_connection_string: str) -> _BlockingConnectionPool:
+    _import_psycopg2()
+    return _BlockingConnectionPool(db_connection_string, config.DB_POOL_MAX_CONN)
+
+def _get_db_pool(db_connection_string: str) -> _BlockingConnectionPool:
+    """
+    Return the shared PostgreSQL connection pool for a connection string.
+    
+    Connections are opened lazily up to DB_POOL_MAX_CONN and reused across
+    uploads instead of paying a new TCP/TLS handshake per insert. The lock
+    keeps concurrent first callers from each building a pool; uploaders
+    cache the result, see DocumentUploader.db_pool.
+    """
+    with _setup_lock:
+        return _build_db_pool(db_connection_string)
+
+def _prepare_insert_document(conn) -> None:
+    """Prepare the document INSERT on a pooled connection the first time it is used."""
+    if conn in _prepared_connections:
+        return
+    
+    cursor = conn.cursor()
+    cursor.execute(_PREPARE_INSERT_DOCUMENT)
+    cursor.close()
+    
+    # PREPARE is session-scoped and survives a rollback, so the statement
+    # lasts as long as the pooled connection without a commit of its own
+    _prepared_connections.add(conn)
+
+class _AsyncFileReader:
+    """
+    Binary file wrapper whose reads run in a worker thread.
+    
+    aioboto3 awaits read() when it returns an awaitable, so wrapping the
+    file handle keeps the disk reads of an upload off the event loop.
+    """
+    
+    def __init__(self, file_obj: BinaryIO):
+        self._file_obj = file_obj
+    
+    async def read(self, size: int = -1) -> bytes:
+        return await asyncio.to_thread(self._file_obj.read, size)
 
 class DocumentUploader:
     """
@@ -38,11 +269,12 @@ class DocumentUploader:
             db_connection_string: PostgreSQL database connection string (optional, uses config if not provided)
         """
         # Use provided values or fall back to config
-        self.aws_access_key_id = aws_access_key_id or config.AWS_ACCESS_KEY_ID
-        self.aws_secret_access_key = aws_secret_access_key or config.AWS_SECRET_ACCESS_KEY
-        self.aws_region = aws_region or config.AWS_REGION
-        self.s3_bucket_name = s3_bucket_name or config.S3_BUCKET_NAME
-        self.db_connection_string = db_connection_string or config.get_database_url()
+        cfg = config
+        self.aws_access_key_id = aws_access_key_id or cfg.AWS_ACCESS_KEY_ID
+        self.aws_secret_access_key = aws_secret_access_key or cfg.AWS_SECRET_ACCESS_KEY
+        self.aws_region = aws_region or cfg.AWS_REGION
+        self.s3_bucket_name = s3_bucket_name or cfg.S3_BUCKET_NAME
+        self.db_connection_string = db_connection_string or get_database_url()
         
         # Validate configuration
         if not all([self.aws_access_key_id, self.aws_secret_access_key, self.aws_region]):
@@ -50,25 +282,52 @@ class DocumentUploader:
         if not self.db_connection_string:
             raise ValueError("Database connection string is required")
         
-        # Initialize AWS S3 client
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-            region_name=self.aws_region
-        )
+        # The S3 client is looked up on first use, see s3_client
+        self._s3_client = None
         
-        # Supported file extensions from config
-        self.supported_extensions = set(config.SUPPORTED_EXTENSIONS)
+        # The database pool is looked up on first use, see db_pool
+        self._db_pool = None
         
-        # Set up logging
-        logging.basicConfig(level=getattr(logging, config.LOG_LEVEL))
-        self.logger = logging.getLogger(__name__)
+        # Async S3 client and asyncpg pool, open only inside ``async with uploader``
+        self._async_stack = None
+        self._async_s3_client = None
+        self._async_pool = None
+        
+        # Public URL prefix for objects in the bucket
+        self._s3_url_prefix = f"https://{self.s3_bucket_name}.s3.{self.aws_region}.amazonaws.com/"
+        
+        self.logger = logger
+    
+    @property
+    def s3_client(self):
+        """Shared S3 client for this uploader's credentials, created on first use."""
+        if self._s3_client is None:
+            self._s3_client = _get_s3_client(
+                self.aws_access_key_id,
+                self.aws_secret_access_key,
+                self.aws_region
+            )
+        return self._s3_client
+    
+    @s3_client.setter
+    def s3_client(self, s3_client) -> None:
+        self._s3_client = s3_client
+    
+    @property
+    def db_pool(self) -> _BlockingConnectionPool:
+        """Shared connection pool for this uploader's database, looked up on first use."""
+        if self._db_pool is None:
+            self._db_pool = _get_db_pool(self.db_connection_string)
+        return self._db_pool
         
     def validate_file(self, file_path: str) -> Dict[str, Any]:
         """
         Validate uploaded file format and size.
         
+        The file is opened once and the open handle is returned under
+        'file_obj' for the upload step; the caller is responsible for
+        closing it.
+        
         Args:
             file_path: Path to the file to validate
             
@@ -76,42 +335,51 @@ class DocumentUploader:
             Dict containing validation results and file info
         """
         try:
-            file_path = Path(file_path)
+            file_path = os.fspath(file_path)
+            file_name = os.path.basename(file_path)
             
-            # Check if file exists
-            if not file_path.exists():
+            # Check file extension before touching the filesystem
+            file_extension = sys.intern(os.path.splitext(file_name)[1].lower())
+            if file_extension not in _SUPPORTED_EXTENSIONS:
                 return {
                     'valid': False,
-                    'error': 'File does not exist'
+                    'error': f'Unsupported file format. Supported formats: {_SUPPORTED_EXTENSIONS_MSG}'
                 }
             
-            # Check file extension
-            file_extension = file_path.suffix.lower()
-            if file_extension not in self.supported_extensions:
+            # Open the file once; a missing file fails here instead of via exists()
+            try:
+                file_obj = open(file_path, 'rb')
+            except FileNotFoundError:
                 return {
                     'valid': False,
-                    'error': f'Unsupported file format. Supported formats: {", ".join(self.supported_extensions)}'
-                }
-            
-            # Check file size (from config)
-            file_size = file_path.stat().st_size
-            max_size = config.MAX_FILE_SIZE
-            if file_size > max_size:
-                return {
-                    'valid': False,
-                    'error': f'File too large. Maximum size: {max_size / (1024*1024):.0f}MB, Current size: {file_size / (1024*1024):.2f}MB'
+                    'error': 'File does not exist'
                 }
             
-            # Get MIME type
-            mime_type, _ = mimetypes.guess_type(str(file_path))
+            try:
+                # Check file size (from config) on the already-open descriptor
+                file_size = os.fstat(file_obj.fileno()).st_size
+                max_size = _MAX_FILE_SIZE
+                if file_size > max_size:
+                    file_obj.close()
+                    return {
+                        'valid': False,
+                        'error': f'File too large. Maximum size: {max_size / (1024*1024):.0f}MB, Current size: {file_size / (1024*1024):.2f}MB'
+                    }
+                
+                # Get MIME type
+                mime_type = _MIME_TYPES.get(file_extension)
+            except BaseException:
+                file_obj.close()
+                raise
             
             return {
                 'valid': True,
-                'file_name': file_path.name,
+                'file_name': file_name,
                 'file_extension': file_extension,
                 'file_size': file_size,
                 'mime_type': mime_type,
-                'file_path': str(file_path)
+                'file_path': file_path,
+                'file_obj': file_obj
             }
             
         except Exception as e:
@@ -120,27 +388,30 @@ class DocumentUploader:
                 'error': f'Validation error: {str(e)}'
             }
     
-    def upload_to_s3(self, file_path: str, file_name: str) -> Dict[str, Any]:
+    def upload_to_s3(self, file_obj: BinaryIO, file_name: str) -> Dict[str, Any]:
         """
         Upload file to Amazon S3.
         
         Args:
-            file_path: Local path to the file
+            file_obj: Open binary file handle, as returned by validate_file
             file_name: Name to use for the file in S3
             
         Returns:
             Dict containing upload results and S3 URL
         """
+        # Bind ClientError and the transfer settings even if the client was injected
+        _import_boto3()
         try:
-            # Upload file to S3
-            self.s3_client.upload_file(
-                file_path,
+            # Upload file to S3 from the already-open handle
+            self.s3_client.upload_fileobj(
+                file_obj,
                 self.s3_bucket_name,
-                file_name
+                file_name,
+                Config=_TRANSFER_CONFIG
             )
             
             # Generate S3 URL
-            s3_url = f"https://{self.s3_bucket_name}.s3.{self.aws_region}.amazonaws.com/{file_name}"
+            s3_url = self._s3_url_prefix + file_name
             
             return {
                 'success': True,
@@ -159,7 +430,8 @@ class DocumentUploader:
                 'error': f'Upload error: {str(e)}'
             }
     
-    def save_to_database(self, file_metadata: Dict[str, Any], s3_url: str, user_id: str) -> Dict[str, Any]:
+    def save_to_database(self, file_metadata: Dict[str, Any], s3_url: str, user_id: str,
+                         document_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Save file metadata to PostgreSQL database.
         
@@ -167,58 +439,383 @@ class DocumentUploader:
             file_metadata: File validation metadata
             s3_url: URL of the uploaded file in S3
             user_id: ID of the user who uploaded the document
+            document_id: ID for the new record (optional, generated if not provided)
             
         Returns:
             Dict containing database operation results
         """
         try:
-            # Connect to database
-            conn = psycopg2.connect(self.db_connection_string)
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            # Borrow a connection from the shared pool
+            pool = self.db_pool
+            conn = pool.getconn()
+            try:
+                _prepare_insert_document(conn)
+                cursor = conn.cursor()
+                
+                # Generate unique document ID unless one was supplied
+                if document_id is None:
+                    document_id = uuid.uuid4().hex
+                
+                # Insert document metadata through the prepared statement
+                cursor.execute(_EXECUTE_INSERT_DOCUMENT, (
+                    document_id,
+                    user_id,
+                    file_metadata['file_name'],
+                    file_metadata['file_extension'],
+                    file_metadata['file_size'],
+                    file_metadata['mime_type'],
+                    s3_url,
+                    'uploaded'
+                ))
+                
+                # Commit transaction
+                conn.commit()
+                
+                cursor.close()
+            finally:
+                # Return the connection; the pool rolls back any open transaction
+                pool.putconn(conn)
             
-            # Generate unique document ID
-            document_id = str(uuid.uuid4())
+            return {
+                'success': True,
+                'document_id': document_id,
+                'message': 'Document metadata saved successfully'
+            }
             
-            # Insert document metadata
-            insert_query = """
-                INSERT INTO documents (
-                    document_id, 
-                    user_id,
-                    file_name, 
-                    file_extension, 
-                    file_size, 
-                    mime_type, 
-                    s3_url, 
-                    upload_date, 
-                    status
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING document_id
-            """
-            
-            cursor.execute(insert_query, (
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Database error: {str(e)}'
+            }
+    
+    def _validate_and_upload(self, file_path: str) -> Dict[str, Any]:
+        """
+        Validate a file and upload it to S3 under a newly generated document ID.
+        
+        Args:
+            file_path: Path to the document file
+            
+        Returns:
+            Dict containing the document ID, validation and S3 upload results
+        """
+        # Step 1: Validate file
+        validation_result = self.validate_file(file_path)
+        if not validation_result['valid']:
+            return {
+                'success': False,
+                'error': validation_result['error']
+            }
+        
+        # Step 2: Generate unique ID, shared by the S3 key and the database record
+        document_id = uuid.uuid4().hex
+        unique_name = document_id + validation_result['file_extension']
+        
+        # Step 3: Upload to S3 from the handle opened during validation
+        with validation_result['file_obj'] as file_obj:
+            upload_result = self.upload_to_s3(file_obj, unique_name)
+        if not upload_result['success']:
+            return {
+                'success': False,
+                'error': upload_result['error']
+            }
+        
+        return {
+            'success': True,
+            'document_id': document_id,
+            'validation': validation_result,
+            'upload': upload_result
+        }
+    
+    def _try_validate_and_upload(self, file_path: str) -> Dict[str, Any]:
+        """
+        Run _validate_and_upload for one item of a batch.
+        
+        Any exception becomes a failed result for that item, so one bad file
+        cannot abort the rest of the batch.
+        """
+        try:
+            return self._validate_and_upload(file_path)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Upload failed: {str(e)}'
+            }
+    
+    def upload_document(self, file_path: str, user_id: str) -> Dict[str, Any]:
+        """
+        Main function to upload a syllabus document.
+        
+        Args:
+            file_path: Path to the document file
+            user_id: ID of the user who uploaded the document
+            
+        Returns:
+            Dict containing upload results
+        """
+        try:
+            # Steps 1-3: Validate file and upload it to S3
+            staged = self._validate_and_upload(file_path)
+            if not staged['success']:
+                return staged
+            validation_result = staged['validation']
+            upload_result = staged['upload']
+            
+            # Step 4: Save metadata to database
+            db_result = self.save_to_database(validation_result, upload_result['s3_url'], user_id,
+                                              staged['document_id'])
+            if not db_result['success']:
+                return {
+                    'success': False,
+                    'error': db_result['error']
+                }
+            
+            return {
+                'success': True,
+                'document_id': db_result['document_id'],
+                'file_name': validation_result['file_name'],
+                's3_url': upload_result['s3_url'],
+                'message': 'Document uploaded successfully'
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Upload failed: {str(e)}'
+            }
+
+    def upload_documents(self, items: List[Tuple[str, str]], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Upload a batch of syllabus documents.
+        
+        Files are validated and uploaded to S3 in parallel, then all metadata
+        rows are written with multi-row INSERTs on one pooled connection inside
+        a single transaction. Rows are sent in pages of UPLOAD_BATCH_SIZE.
+        
+        Args:
+            items: List of (file_path, user_id) pairs
+            max_workers: Maximum number of concurrent S3 uploads (optional,
+                capped at the S3 client's connection pool size)
+            
+        Returns:
+            List of upload results, one per item and in the same order
+        """
+        results: List[Dict[str, Any]] = [None] * len(items)
+        if not items:
+            return results
+        
+        # Steps 1-3: Validate and upload every file to S3 concurrently
+        max_workers = min(max_workers or _S3_UPLOAD_WORKERS, _S3_UPLOAD_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            staged_results = list(executor.map(self._try_validate_and_upload, [item[0] for item in items]))
+        
+        rows = []
+        pending = []
+        for index, ((_, user_id), staged) in enumerate(zip(items, staged_results)):
+            if not staged['success']:
+                results[index] = staged
+                continue
+            
+            validation_result = staged['validation']
+            document_id = staged['document_id']
+            rows.append((
                 document_id,
                 user_id,
-                file_metadata['file_name'],
-                file_metadata['file_extension'],
-                file_metadata['file_size'],
-                file_metadata['mime_type'],
-                s3_url,
-                datetime.utcnow(),
+                validation_result['file_name'],
+                validation_result['file_extension'],
+                validation_result['file_size'],
+                validation_result['mime_type'],
+                staged['upload']['s3_url'],
                 'uploaded'
             ))
+            pending.append((index, document_id, validation_result, staged['upload']))
+        
+        if not rows:
+            return results
+        
+        # Step 4: Save all metadata in one transaction
+        try:
+            pool = self.db_pool
+            conn = pool.getconn()
+            try:
+                cursor = conn.cursor()
+                execute_values(cursor, """
+                    INSERT INTO documents (
+                        document_id, 
+                        user_id,
+                        file_name, 
+                        file_extension, 
+                        file_size, 
+                        mime_type, 
+                        s3_url, 
+                        status
+                    ) VALUES %s
+                """, rows, page_size=config.UPLOAD_BATCH_SIZE)
+                conn.commit()
+                cursor.close()
+            finally:
+                pool.putconn(conn)
+        except Exception as e:
+            for index, _, _, _ in pending:
+                results[index] = {
+                    'success': False,
+                    'error': f'Database error: {str(e)}'
+                }
+            return results
+        
+        for index, document_id, validation_result, upload_result in pending:
+            results[index] = {
+                'success': True,
+                'document_id': document_id,
+                'file_name': validation_result['file_name'],
+                's3_url': upload_result['s3_url'],
+                'message': 'Document uploaded successfully'
+            }
+        
+        return results
+
+    async def __aenter__(self) -> 'DocumentUploader':
+        """
+        Open an async S3 client and an asyncpg pool on the running event loop.
+        
+        The async upload methods reuse both until the block exits. Outside an
+        ``async with`` block each call opens and closes its own client and
+        database connection, which is correct but slower.
+        """
+        if self._async_stack is not None:
+            raise RuntimeError("DocumentUploader async resources are already open")
+        
+        await _import_async_clients_off_loop()
+        stack = AsyncExitStack()
+        try:
+            s3_client = await stack.enter_async_context(self._open_async_s3_client())
+            pool = await asyncpg.create_pool(
+                self.db_connection_string,
+                min_size=1,
+                max_size=config.DB_POOL_MAX_CONN
+            )
+            stack.push_async_callback(pool.close)
+        except BaseException:
+            await stack.aclose()
+            raise
+        
+        self._async_stack = stack
+        self._async_s3_client = s3_client
+        self._async_pool = pool
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the async S3 client and asyncpg pool."""
+        stack = self._async_stack
+        self._async_stack = self._async_s3_client = self._async_pool = None
+        if stack is not None:
+            await stack.aclose()
+    
+    def _open_async_s3_client(self):
+        """Return an aioboto3 S3 client context manager for this uploader's credentials."""
+        _import_async_clients()
+        return _aioboto3_session.client(
+            's3',
+            aws_access_key_id=self.aws_access_key_id,
+            aws_secret_access_key=self.aws_secret_access_key,
+            region_name=self.aws_region,
+            config=BotoConfig(
+                max_pool_connections=_S3_MAX_POOL_CONNECTIONS,
+                s3={'use_accelerate_endpoint': config.S3_USE_ACCELERATE_ENDPOINT}
+            )
+        )
+    
+    async def upload_to_s3_async(self, file_obj: BinaryIO, file_name: str) -> Dict[str, Any]:
+        """
+        Upload file to Amazon S3 without blocking the event loop.
+        
+        Args:
+            file_obj: Open binary file handle, as returned by validate_file
+            file_name: Name to use for the file in S3
             
-            # Commit transaction
-            conn.commit()
+        Returns:
+            Dict containing upload results and S3 URL
+        """
+        await _import_async_clients_off_loop()
+        try:
+            async with AsyncExitStack() as stack:
+                # Reuse the client opened by ``async with uploader``, else open one for this call
+                s3_client = self._async_s3_client
+                if s3_client is None:
+                    s3_client = await stack.enter_async_context(self._open_async_s3_client())
+                
+                # Read the file in a worker thread so large uploads don't stall the loop
+                await s3_client.upload_fileobj(
+                    _AsyncFileReader(file_obj),
+                    self.s3_bucket_name,
+                    file_name,
+                    Config=_TRANSFER_CONFIG
+                )
             
-            # Get inserted record
-            result = cursor.fetchone()
+            # Generate S3 URL
+            s3_url = self._s3_url_prefix + file_name
             
-            cursor.close()
-            conn.close()
+            return {
+                'success': True,
+                's3_url': s3_url,
+                's3_key': file_name
+            }
+            
+        except ClientError as e:
+            return {
+                'success': False,
+                'error': f'S3 upload error: {str(e)}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Upload error: {str(e)}'
+            }
+    
+    async def save_to_database_async(self, file_metadata: Dict[str, Any], s3_url: str, user_id: str,
+                                     document_id: Optional[str] = None,
+                                     pool: Optional['asyncpg.Pool'] = None) -> Dict[str, Any]:
+        """
+        Save file metadata to PostgreSQL database using asyncpg.
+        
+        Args:
+            file_metadata: File validation metadata
+            s3_url: URL of the uploaded file in S3
+            user_id: ID of the user who uploaded the document
+            document_id: ID for the new record (optional, generated if not provided)
+            pool: asyncpg pool or connection to use (optional, defaults to the pool
+                opened by ``async with uploader``, else a connection for this call)
+            
+        Returns:
+            Dict containing database operation results
+        """
+        try:
+            async with AsyncExitStack() as stack:
+                if pool is None:
+                    pool = self._async_pool
+                if pool is None:
+                    await _import_async_clients_off_loop()
+                    pool = await asyncpg.connect(self.db_connection_string)
+                    stack.push_async_callback(pool.close)
+                
+                # Generate unique document ID unless one was supplied
+                if document_id is None:
+                    document_id = uuid.uuid4().hex
+                
+                await pool.execute(
+                    _INSERT_DOCUMENT,
+                    document_id,
+                    user_id,
+                    file_metadata['file_name'],
+                    file_metadata['file_extension'],
+                    file_metadata['file_size'],
+                    file_metadata['mime_type'],
+                    s3_url,
+                    'uploaded'
+                )
             
             return {
                 'success': True,
-                'document_id': result['document_id'],
+                'document_id': document_id,
                 'message': 'Document metadata saved successfully'
             }
             
@@ -228,9 +825,13 @@ class DocumentUploader:
                 'error': f'Database error: {str(e)}'
             }
     
-    def upload_document(self, file_path: str, user_id: str) -> Dict[str, Any]:
+    async def upload_document_async(self, file_path: str, user_id: str) -> Dict[str, Any]:
         """
-        Main function to upload a syllabus document.
+        Upload a syllabus document without blocking the event loop.
+        
+        The asynchronous counterpart of upload_document. Use it inside
+        ``async with uploader:`` so the S3 client and database pool are
+        shared across uploads.
         
         Args:
             file_path: Path to the document file
@@ -240,20 +841,21 @@ class DocumentUploader:
             Dict containing upload results
         """
         try:
-            # Step 1: Validate file
-            validation_result = self.validate_file(file_path)
+            # Step 1: Validate file off the event loop
+            validation_result = await asyncio.to_thread(self.validate_file, file_path)
             if not validation_result['valid']:
                 return {
                     'success': False,
                     'error': validation_result['error']
                 }
             
-            # Step 2: Generate unique S3 key
-            file_extension = validation_result['file_extension']
-            unique_name = f"{uuid.uuid4()}{file_extension}"
+            # Step 2: Generate unique ID, shared by the S3 key and the database record
+            document_id = uuid.uuid4().hex
+            unique_name = document_id + validation_result['file_extension']
             
-            # Step 3: Upload to S3
-            upload_result = self.upload_to_s3(file_path, unique_name)
+            # Step 3: Upload to S3 from the handle opened during validation
+            with validation_result['file_obj'] as file_obj:
+                upload_result = await self.upload_to_s3_async(file_obj, unique_name)
             if not upload_result['success']:
                 return {
                     'success': False,
@@ -261,7 +863,8 @@ class DocumentUploader:
                 }
             
             # Step 4: Save metadata to database
-            db_result = self.save_to_database(validation_result, upload_result['s3_url'], user_id)
+            db_result = await self.save_to_database_async(validation_result, upload_result['s3_url'], user_id,
+                                                          document_id)
             if not db_result['success']:
                 return {
                     'success': False,
@@ -319,7 +922,7 @@ def upload_syllabus_document(file_path: str,
 if __name__ == "__main__":
     try:
         # Validate configuration
-        config.validate_config()
+        validate_config()
         
         # Example upload using environment variables
         result = upload_syllabus_document(